@@ -60,7 +60,9 @@ meaning that this node is essentially a "leaf". This node can perform get remote
 """
 
 # stdlib
+from functools import lru_cache
 from typing import Any as TypeAny
+from typing import Dict as TypeDict
 from typing import List as TypeList
 from typing import Tuple as TypeTuple
 from typing import Union
@@ -76,6 +78,102 @@ from . import module  # noqa: F401
 from . import property  # noqa: F401
 from . import static_attr  # noqa: F401
 
+_ParentNode = Union["module.Module", "klass.Class"]
+
+# Hoisted so the isinstance checks below don't rebuild the tuple per call.
+_PARENT_TYPES = (module.Module, klass.Class)
+
+
+@lru_cache(maxsize=None)
+def _split_path(path: str) -> TypeTuple[str, ...]:
+    """Split a dotted path once and cache the result.
+
+    AST registration resolves the same paths and module prefixes over and over,
+    so caching the split avoids re-scanning the same strings for every entry.
+
+    Args:
+        path: The full path to an object.
+
+    Returns:
+        The segments of the path as a tuple.
+    """
+    return tuple(path.split("."))
+
+
+def _get_parent_from_parts(
+    parts: TypeTuple[str, ...],
+    root: Union[attribute.Attribute, globals.Globals, module.Module],
+) -> Union[module.Module, klass.Class]:
+    """Walk the AST down a pre-split path and return the parent node.
+
+    Args:
+        parts: The segments of the full path to an object.
+        root: The collection of frameworks held in the global namespace.
+
+    Returns:
+        The parent module or class.
+
+    Raises:
+        ValueError: If parent is not a class or module
+    """
+    parent = root
+    for step in parts[:-1]:
+        # A single dict.get probes the hash table once, where a containment
+        # check followed by indexing would probe it twice per step.
+        nxt = parent.attrs.get(step)
+        if nxt is not None:
+            parent = nxt
+
+    if not isinstance(parent, _PARENT_TYPES):
+        raise ValueError(f"Expected (Module, Class), but got {type(parent)}")
+
+    return parent
+
+
+def _new_module_node(
+    client: TypeAny, path_and_name: str, object_ref: TypeAny
+) -> module.Module:
+    """Specialized Module factory for the bulk registration loop.
+
+    Allocates via __new__ and writes the attribute slots directly, skipping
+    keyword binding and the cooperative __init__ chain. The slots mirror
+    attribute.Attribute.__init__; callers must pass a non-None object_ref,
+    since resolving a missing one is the job of the full constructor.
+    """
+    node = module.Module.__new__(module.Module)
+    node.client = client
+    node.path_and_name = path_and_name
+    node.object_ref = object_ref
+    node.return_type_name = ""
+    node.attrs = {}
+    node._parent = None
+    return node
+
+
+def _new_class_node(
+    client: TypeAny,
+    path_and_name: str,
+    object_ref: TypeAny,
+    return_type_name: str,
+    parent: _ParentNode,
+    pointer_name: str,
+) -> klass.Class:
+    """Specialized Class factory for the bulk registration loop.
+
+    Mirrors what klass.Class.__init__ ends up assigning through the
+    Callable/Attribute chain, without the per-call keyword binding.
+    """
+    node = klass.Class.__new__(klass.Class)
+    node.client = client
+    node.path_and_name = path_and_name
+    node.object_ref = object_ref
+    node.return_type_name = return_type_name
+    node.attrs = {}
+    node._parent = parent
+    node.is_static = False
+    node.pointer_name = pointer_name
+    return node
+
 
 def get_parent(
     path: str, root: Union[attribute.Attribute, globals.Globals, module.Module]
@@ -95,15 +193,14 @@ def get_parent(
     Examples:
         For instance, given the syft project root directory, the parent to the path `syft.lib.python.Int` is `python`.
     """
-    parent = root
-    for step in path.split(".")[:-1]:
-        if step in parent.attrs:
-            parent = parent.attrs[step]
+    if "." not in path:
+        # Single-segment paths sit directly under the root, so there is no
+        # walk to do and nothing to split.
+        if not isinstance(root, _PARENT_TYPES):
+            raise ValueError(f"Expected (Module, Class), but got {type(root)}")
+        return root
 
-    if not isinstance(parent, (module.Module, klass.Class)):
-        raise ValueError(f"Expected (Module, Class), but got {type(parent)}")
-
-    return parent
+    return _get_parent_from_parts(_split_path(path), root)
 
 
 def add_modules(
@@ -116,6 +213,8 @@ def add_modules(
         ast: The global AST.
         modules: A list of modules, either a path in string format or a tuple of the path in string and a reference.
     """
+    # Sibling modules share their parent prefix, so resolve each prefix once.
+    parent_memo: TypeDict[TypeTuple[str, ...], _ParentNode] = {}
     for mod in modules:
         # In case reference is present
         if isinstance(mod, tuple):
@@ -123,17 +222,29 @@ def add_modules(
         else:
             target_module, ref = mod, None
 
-        parent = get_parent(target_module, ast)
-        attr_name = target_module.rsplit(".", 1)[-1]
-        parent.add_attr(
-            attr_name=attr_name,
-            attr=module.Module(
+        parts = _split_path(target_module)
+        parent = parent_memo.get(parts[:-1])
+        if parent is None:
+            parent = _get_parent_from_parts(parts, ast)
+            parent_memo[parts[:-1]] = parent
+        attr_name = parts[-1]
+        if ref is not None:
+            new_module = _new_module_node(ast.client, target_module, ref)
+        else:
+            # The full constructor resolves a missing object_ref through
+            # sys.modules, so it cannot be bypassed here.
+            new_module = module.Module(
                 path_and_name=target_module,
                 object_ref=ref,
                 return_type_name="",
                 client=ast.client,
-            ),
+            )
+        parent.add_attr(
+            attr_name=attr_name,
+            attr=new_module,
         )
+        # The new module may be the parent of entries later in the list.
+        parent_memo[parts] = new_module
 
 
 def add_classes(
@@ -146,19 +257,23 @@ def add_classes(
         ast: The global AST.
         paths: A list of classes, each of which is a tuple of the path, the return type, and its reference.
     """
+    parent_memo: TypeDict[TypeTuple[str, ...], _ParentNode] = {}
     for path, return_type, ref in paths:
-        parent = get_parent(path, ast)
-        attr_name = path.rsplit(".", 1)[-1]
+        parts = _split_path(path)
+        parent = parent_memo.get(parts[:-1])
+        if parent is None:
+            parent = _get_parent_from_parts(parts, ast)
+            parent_memo[parts[:-1]] = parent
+        attr_name = parts[-1]
+        new_class = _new_class_node(
+            ast.client, path, ref, return_type, parent, attr_name + "Pointer"
+        )
         parent.add_attr(
             attr_name=attr_name,
-            attr=klass.Class(
-                path_and_name=path,
-                object_ref=ref,
-                return_type_name=return_type,
-                client=ast.client,
-                parent=parent,
-            ),
+            attr=new_class,
         )
+        # The new class may be the parent of nested classes later in the list.
+        parent_memo[parts] = new_class
 
 
 def add_methods(
@@ -171,9 +286,16 @@ def add_methods(
         ast: The global AST.
         paths: A list of methods, each of which is a tuple of the method's path and its return type.
     """
+    # Sibling methods of the same class share their parent prefix, so the walk
+    # from the root only has to happen once per unique prefix.
+    parent_memo: TypeDict[TypeTuple[str, ...], _ParentNode] = {}
     for path, return_type in paths:
-        parent = get_parent(path, ast)
-        path_list = path.split(".")
+        parts = _split_path(path)
+        parent = parent_memo.get(parts[:-1])
+        if parent is None:
+            parent = _get_parent_from_parts(parts, ast)
+            parent_memo[parts[:-1]] = parent
+        path_list = list(parts)
         parent.add_path(
             path=path_list,
             index=len(path_list) - 1,
@@ -184,6 +306,11 @@ def add_methods(
 def add_dynamic_objects(
     ast: globals.Globals, paths: TypeList[TypeTuple[str, str]]
 ) -> None:
+    parent_memo: TypeDict[TypeTuple[str, ...], _ParentNode] = {}
     for path, return_type in paths:
-        parent = get_parent(path, ast)
+        parts = _split_path(path)
+        parent = parent_memo.get(parts[:-1])
+        if parent is None:
+            parent = _get_parent_from_parts(parts, ast)
+            parent_memo[parts[:-1]] = parent
         parent.add_dynamic_object(path_and_name=path, return_type_name=return_type)
@@ -192,6 +192,19 @@ class Domain(Node):
     def id(self) -> UID:
         return self.domain.id
 
+    def stats_snapshot(self) -> Tuple[int, int, int, int]:
+        """Return (objects, requests, messages, request handlers) counts.
+
+        One call for everything the duet live-status display needs, so pollers
+        don't make four separate attribute round trips per refresh.
+        """
+        return (
+            len(self.store),
+            len(self.requests),
+            self.message_counter,
+            len(self.request_handlers),
+        )
+
     def message_is_for_me(self, msg: Union[SyftMessage, SignedMessage]) -> bool:
 
         # this needs to be defensive by checking domain_id NOT domain.id or it breaks
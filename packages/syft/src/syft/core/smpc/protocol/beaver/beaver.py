@@ -7,8 +7,10 @@ Computer Science, pages 420–432. Springer, 1991.
 
 
 # stdlib
+import functools
 import operator
 import secrets
+import threading
 from typing import Any
 from typing import Dict
 from typing import List
@@ -27,6 +29,115 @@ from ...store.exceptions import EmptyPrimitiveStore
 
 ttp_generator = np.random.default_rng()
 
+# The only operators triples are generated for; a direct dict lookup is
+# cheaper than resolving the name through the operator module on every call.
+_CMD_TABLE: Dict[str, Any] = {"mul": operator.mul, "matmul": operator.matmul}
+
+# Ring bounds rarely change between calls, so cache them per ring size and
+# pre-populate the default ring used by ShareTensor.
+_RING_MINMAX_CACHE: Dict[int, Tuple[int, int]] = {
+    2 ** 32: ShareTensor.compute_min_max_from_ring(2 ** 32)
+}
+
+
+# Batched entropy for share seeds; refilled 4096 bytes at a time so that one
+# urandom read serves 1024 seeds instead of one syscall per triple.
+_SEED_POOL = bytearray()
+_SEED_POOL_LOCK = threading.Lock()
+
+
+def _next_seed() -> int:
+    """Return a fresh 32-bit seed from the batched entropy pool."""
+    # The pool replaces the thread-safe secrets.randbits, so the read and the
+    # truncate must happen atomically -- concurrent callers drawing the same
+    # bytes would seed two triple batches with identical mask streams.
+    with _SEED_POOL_LOCK:
+        if not _SEED_POOL:
+            _SEED_POOL.extend(secrets.token_bytes(4096))
+        seed = int.from_bytes(_SEED_POOL[-4:], "little")
+        del _SEED_POOL[-4:]
+    return seed
+
+
+def _store_add_triples(
+    store: Dict[str, Any], config_key: str, primitives: List[Any]
+) -> None:
+    """Append primitive triples to the SoA block stored under config_key.
+
+    All triples for one config key share their shapes, so instead of a queue
+    of boxed per-instance ShareTensor lists the store keeps one contiguous
+    ndarray per triple component plus a metadata template per component, and a
+    head index marking the next unconsumed instance.
+    """
+    if not len(primitives):
+        return
+
+    new_components = [
+        np.stack([instance[component].child for instance in primitives])
+        for component in range(3)
+    ]
+
+    block = store.get(config_key)
+    if block is None:
+        store[config_key] = {
+            # Metadata-only copies; the values live in the stacked arrays.
+            "templates": [share.copy_tensor() for share in primitives[0]],
+            "components": new_components,
+            "head": 0,
+        }
+    else:
+        head = block["head"]
+        block["components"] = [
+            np.concatenate((old[head:], new))
+            for old, new in zip(block["components"], new_components)
+        ]
+        block["head"] = 0
+
+
+def _store_get_triple(store: Dict[str, Any], config_key: str, remove: bool) -> Any:
+    """Retrieve the triple at the head of the SoA block for config_key.
+
+    Raises:
+        EmptyPrimitiveStore: If no primitive in the store for config_key.
+    """
+    try:
+        block = store[config_key]
+    except KeyError:
+        raise EmptyPrimitiveStore(f"{config_key} does not exists in the store")
+
+    head = block["head"]
+    components = block["components"]
+    if head >= len(components[0]):
+        raise EmptyPrimitiveStore(f"No primitive in the store for {config_key}")
+
+    primitive = []
+    for template, component in zip(block["templates"], components):
+        share = template.copy_tensor()
+        share.child = component[head]
+        primitive.append(share)
+
+    if remove:
+        block["head"] = head + 1
+
+    return primitive
+
+
+@functools.lru_cache(maxsize=1024)
+def _mul_config_key(a_shape: Tuple[int, ...], b_shape: Tuple[int, ...]) -> str:
+    """Build (and intern) the store key for a "mul" shape pair.
+
+    The same shape pairs recur for the lifetime of an SMPC computation, so
+    caching the formatted key avoids re-formatting and re-hashing the string
+    on every store access.
+    """
+    return f"beaver_mul_{a_shape}_{b_shape}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _matmul_config_key(a_shape: Tuple[int, ...], b_shape: Tuple[int, ...]) -> str:
+    """Build (and intern) the store key for a "matmul" shape pair."""
+    return f"beaver_matmul_{a_shape}_{b_shape}"
+
 
 def _get_triples(
     op_str: str,
@@ -34,6 +145,7 @@ def _get_triples(
     a_shape: Tuple[int],
     b_shape: Tuple[int],
     ring_size: int = 2 ** 32,
+    count: int = 1,
     **kwargs: Dict[Any, Any],
 ) -> Tuple[Tuple[Tuple[ShareTensor, ShareTensor, ShareTensor]]]:
     """Get triples.
@@ -47,6 +159,7 @@ def _get_triples(
         a_shape (Tuple[int]): Shape of a from beaver triples protocol.
         b_shape (Tuple[int]): Shape of b part from beaver triples protocol.
         ring_size (int) : Ring Size of the triples to generate.
+        count (int): Number of triples to generate in one batch.
         kwargs: Arbitrary keyword arguments for commands.
 
     Returns:
@@ -56,55 +169,69 @@ def _get_triples(
     Raises:
         ValueError: If the triples are not consistent.
         ValueError: If the share class is invalid.
+        ValueError: If count is smaller than one.
     """
-    # relative
-    from ..... import Tensor
-
-    cmd = getattr(operator, op_str)
-    min_value, max_value = ShareTensor.compute_min_max_from_ring(ring_size)
-    seed_shares = secrets.randbits(32)
-
-    a_rand = Tensor(
-        ttp_generator.integers(
-            low=min_value, high=max_value, size=a_shape, endpoint=True, dtype=np.int32
+    if count < 1:
+        raise ValueError(f"Expected a positive number of triples, but got {count}")
+
+    cmd = _CMD_TABLE[op_str]
+    min_max = _RING_MINMAX_CACHE.get(ring_size)
+    if min_max is None:
+        min_max = _RING_MINMAX_CACHE.setdefault(
+            ring_size, ShareTensor.compute_min_max_from_ring(ring_size)
         )
-    )
-    a_shares = MPCTensor._get_shares_from_local_secret(
-        secret=a_rand,
-        nr_parties=nr_parties,
-        shape=a_shape,
-        seed_shares=seed_shares,
+    min_value, max_value = min_max
+    seed_shares = _next_seed()
+
+    # Batched triples get a leading instance axis; the elementwise mul and
+    # matmul both broadcast over it, so one op call covers the whole batch.
+    if count > 1:
+        gen_a_shape: Tuple[int, ...] = (count, *a_shape)
+        gen_b_shape: Tuple[int, ...] = (count, *b_shape)
+    else:
+        gen_a_shape = a_shape
+        gen_b_shape = b_shape
+
+    a_nr_elems = int(np.prod(gen_a_shape))
+    b_nr_elems = int(np.prod(gen_b_shape))
+
+    # Draw both operands from one fused RNG call; a single generator dispatch
+    # and allocation is cheaper than two separate ones.
+    rand_buffer = ttp_generator.integers(
+        low=min_value,
+        high=max_value,
+        size=a_nr_elems + b_nr_elems,
+        endpoint=True,
+        dtype=np.int32,
     )
 
-    b_rand = Tensor(
-        ttp_generator.integers(
-            low=min_value, high=max_value, size=b_shape, endpoint=True, dtype=np.int32
-        )
-    )
+    # The share generation accepts raw ndarrays, so there is no need to wrap
+    # the operands (and unwrap them again downstream) in Tensor objects.
+    a_rand = rand_buffer[:a_nr_elems].reshape(gen_a_shape)
+    b_rand = rand_buffer[a_nr_elems:].reshape(gen_b_shape)
+    c_val = cmd(a_rand, b_rand, **kwargs)
 
-    b_shares = MPCTensor._get_shares_from_local_secret(
-        secret=b_rand,
+    if c_val.dtype != np.int32 and ring_size == 2 ** 32:
+        # The op may accumulate in a wider dtype; reduce modulo the ring with
+        # a mask and reinterpret the low bits as the signed ring element, so
+        # the int64 buffer is not carried through share generation.
+        c_val = (c_val & (ring_size - 1)).astype(np.uint32).view(np.int32)
+
+    # Share all three values from one seeded stream instead of re-seeding the
+    # generator (and regenerating all masks) once per value.
+    a_shares, b_shares, c_shares = MPCTensor._get_shares_from_local_secrets(
+        local_secrets=[a_rand, b_rand, c_val],
+        shapes=[gen_a_shape, gen_b_shape, c_val.shape],
         nr_parties=nr_parties,
-        shape=b_shape,
         seed_shares=seed_shares,
     )
 
-    c_val = cmd(a_rand, b_rand, **kwargs)
-
-    c_shares = MPCTensor._get_shares_from_local_secret(
-        secret=c_val, nr_parties=nr_parties, shape=c_val.shape, seed_shares=seed_shares
-    )
-
-    # We are always creating an instance
-    triple_sequential = [(a_shares, b_shares, c_shares)]
-
     """
     Example -- for n_instances=2 and n_parties=2:
-    For Beaver Triples the "res" would look like:
-    res = [
-        ([a0_sh_p0, a0_sh_p1], [b0_sh_p0, b0_sh_p1], [c0_sh_p0, c0_sh_p1]),
-        ([a1_sh_p0, a1_sh_p1], [b1_sh_p0, b1_sh_p1], [c1_sh_p0, c1_sh_p1])
-    ]
+    For Beaver Triples the shares would look like:
+    a_shares = [a0_sh_p0, a0_sh_p1]
+    b_shares = [b0_sh_p0, b0_sh_p1]
+    c_shares = [c0_sh_p0, c0_sh_p1]
 
     We want to send to each party the values they should hold:
     primitives = [
@@ -115,9 +242,27 @@ def _get_triples(
     The first party (party 0) receives Row 0 and the second party (party 1) receives Row 1
     """
 
-    triple = list(
-        map(list, zip(*map(lambda x: map(list, zip(*x)), triple_sequential)))  # type: ignore
-    )
+    if count == 1:
+        # Single instance per call, so the per-party regrouping is a direct
+        # indexing pass instead of nested map/zip transposes.
+        triple = [
+            [[a_shares[party], b_shares[party], c_shares[party]]]
+            for party in range(nr_parties)
+        ]
+    else:
+        # Slice the batched shares back into per-instance triples;
+        # ShareTensor.__getitem__ keeps the share metadata on each slice.
+        triple = [
+            [
+                [
+                    a_shares[party][instance],
+                    b_shares[party][instance],
+                    c_shares[party][instance],
+                ]
+                for instance in range(count)
+            ]
+            for party in range(nr_parties)
+        ]
 
     return triple  # type: ignore
 
@@ -144,7 +289,7 @@ def get_triples_mul(
 
 @register_primitive_store_add("beaver_mul")
 def mul_store_add(
-    store: Dict[str, List[Any]],
+    store: Dict[str, Any],
     primitives: List[Any],
     a_shape: Tuple[int],
     b_shape: Tuple[int],
@@ -152,21 +297,17 @@ def mul_store_add(
     """Add the primitives required for the "mul" operation to the CryptoStore.
 
     Arguments:
-        store (Dict[str, List[Any]]): the CryptoStore
+        store (Dict[str, Any]): the CryptoStore
         primitives (List[Any]): the list of primitives
         a_shape (Tuple[int]): the shape of the first operand
         b_shape (Tuple[int]): the shape of the second operand
     """
-    config_key = f"beaver_mul_{a_shape}_{b_shape}"
-    if config_key in store:
-        store[config_key].extend(primitives)
-    else:
-        store[config_key] = primitives
+    _store_add_triples(store, _mul_config_key(a_shape, b_shape), primitives)
 
 
 @register_primitive_store_get("beaver_mul")
 def mul_store_get(
-    store: Dict[str, List[Any]],
+    store: Dict[str, Any],
     a_shape: Tuple[int, ...],
     b_shape: Tuple[int, ...],
     remove: bool = True,
@@ -176,7 +317,7 @@ def mul_store_get(
     Those are needed for executing the "mul" operation.
 
     Args:
-        store (Dict[str, List[Any]]): The CryptoStore.
+        store (Dict[str, Any]): The CryptoStore.
         a_shape (Tuple[int]): The shape of the first operand.
         b_shape (Tuple[int]): The shape of the second operand.
         remove (bool): True if the primitives should be removed from the store.
@@ -187,22 +328,12 @@ def mul_store_get(
     Raises:
         EmptyPrimitiveStore: If no primitive in the store for config_key.
     """
-    config_key = f"beaver_mul_{tuple(a_shape)}_{tuple(b_shape)}"
-
-    try:
-        primitives = store[config_key]
-    except KeyError:
-        raise EmptyPrimitiveStore(f"{config_key} does not exists in the store")
-
-    try:
-        primitive = primitives[0]
-    except Exception:
-        raise EmptyPrimitiveStore(f"No primitive in the store for {config_key}")
+    if type(a_shape) is not tuple:
+        a_shape = tuple(a_shape)
+    if type(b_shape) is not tuple:
+        b_shape = tuple(b_shape)
 
-    if remove:
-        del primitives[0]
-
-    return primitive
+    return _store_get_triple(store, _mul_config_key(a_shape, b_shape), remove)
 
 
 # Beaver Operations defined for Matrix Multiplication
@@ -227,7 +358,7 @@ def get_triples_matmul(
 
 @register_primitive_store_add("beaver_matmul")
 def matmul_store_add(
-    store: Dict[str, List[Any]],
+    store: Dict[str, Any],
     primitives: List[Any],
     a_shape: Tuple[int],
     b_shape: Tuple[int],
@@ -235,22 +366,18 @@ def matmul_store_add(
     """Add the primitives required for the "matmul" operation to the CryptoStore.
 
     Args:
-        store (Dict[str, List[Any]]): The CryptoStore.
+        store (Dict[str, Any]): The CryptoStore.
         primitives (List[Any]): The list of primitives
         a_shape (Tuple[int]): The shape of the first operand.
         b_shape (Tuple[int]): The shape of the second operand.
 
     """
-    config_key = f"beaver_matmul_{a_shape}_{b_shape}"
-    if config_key in store:
-        store[config_key].extend(primitives)
-    else:
-        store[config_key] = primitives
+    _store_add_triples(store, _matmul_config_key(a_shape, b_shape), primitives)
 
 
 @register_primitive_store_get("beaver_matmul")
 def matmul_store_get(
-    store: Dict[str, List[Any]],
+    store: Dict[str, Any],
     a_shape: Tuple[int, ...],
     b_shape: Tuple[int, ...],
     remove: bool = True,
@@ -260,7 +387,7 @@ def matmul_store_get(
     Those are needed for executing the "matmul" operation.
 
     Args:
-        store (Dict[str, List[Any]]): The CryptoStore.
+        store (Dict[str, Any]): The CryptoStore.
         a_shape (Tuple[int]): The shape of the first operand.
         b_shape (Tuple[int]): The shape of the second operand.
         remove (bool): True if the primitives should be removed from the store.
@@ -271,19 +398,9 @@ def matmul_store_get(
     Raises:
         EmptyPrimitiveStore: If no primitive in the store for config_key.
     """
-    config_key = f"beaver_matmul_{tuple(a_shape)}_{tuple(b_shape)}"
+    if type(a_shape) is not tuple:
+        a_shape = tuple(a_shape)
+    if type(b_shape) is not tuple:
+        b_shape = tuple(b_shape)
 
-    try:
-        primitives = store[config_key]
-    except KeyError:
-        raise EmptyPrimitiveStore(f"{config_key} does not exists in the store")
-
-    try:
-        primitive = primitives[0]
-    except Exception:
-        raise EmptyPrimitiveStore(f"No primitive in the store for {config_key}")
-
-    if remove:
-        del primitives[0]
-
-    return primitive
+    return _store_get_triple(store, _matmul_config_key(a_shape, b_shape), remove)
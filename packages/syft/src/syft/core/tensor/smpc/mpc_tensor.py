@@ -239,6 +239,44 @@ class MPCTensor(PassthroughTensor):
 
         return shares
 
+    @staticmethod
+    def _get_shares_from_local_secrets(
+        local_secrets: List[Any],
+        shapes: List[Tuple[int, ...]],
+        nr_parties: int,
+        seed_shares: int,
+    ) -> List[List[ShareTensor]]:
+        """Secret share several local values from a single PRZS stream.
+
+        Calling _get_shares_from_local_secret once per secret re-seeds the
+        generator for every party of every secret and regenerates all masks
+        each time. When multiple secrets are shared under the same seed (as
+        the beaver triple generation does), seeding once and drawing every
+        mask exactly once from a continuous stream avoids the redundant PRNG
+        work.
+
+        Args:
+            local_secrets (List[Any]): The local secrets to share.
+            shapes (List[Tuple[int, ...]]): The shape of each secret.
+            nr_parties (int): The number of parties.
+            seed_shares (int): The seed for the share generator.
+
+        Returns:
+            List[List[ShareTensor]]: The list of shares (one per party) for
+            each secret, in the order the secrets were given.
+        """
+        generator = np.random.default_rng(seed_shares)
+
+        return [
+            ShareTensor.generate_przs_shares(
+                value=secret,
+                shape=shape,
+                nr_parties=nr_parties,
+                generator=generator,
+            )
+            for secret, shape in zip(local_secrets, shapes)
+        ]
+
     def request(
         self,
         reason: str = "",
@@ -25,6 +25,41 @@ from ...common.serde.serializable import serializable
 from ...common.serde.serialize import _serialize as serialize
 from ..passthrough import PassthroughTensor  # type: ignore
 
+# Bound on first use; the import has to be deferred because syft.core.tensor
+# imports this module at load time, but paying the sys.modules probe on every
+# generate_przs call adds up.
+_Tensor: Optional[type] = None
+
+
+def _get_tensor_type() -> type:
+    """Return the syft Tensor class, importing it lazily once."""
+    global _Tensor
+    if _Tensor is None:
+        # relative
+        from ..tensor import Tensor
+
+        _Tensor = Tensor
+    return _Tensor
+
+
+def _przs_combine(
+    value: np.ndarray, mask_a: np.ndarray, mask_b: np.ndarray
+) -> np.ndarray:
+    """Fold the two PRZS masks into a share value in a single pass."""
+    return value + mask_a - mask_b
+
+
+try:
+    # third party
+    import numba
+
+    # When numba is available, compile the combiner so the add and subtract
+    # fuse into one kernel instead of materializing the mask difference.
+    _przs_combine = numba.njit(cache=True)(_przs_combine)
+except ImportError:  # pragma: no cover
+    pass
+
+
 METHODS_FORWARD_ALL_SHARES = {
     "repeat",
     "copy",
@@ -131,10 +166,8 @@ class ShareTensor(PassthroughTensor):
         seed_shares: int,
     ) -> "ShareTensor":
 
-        # relative
-        from ..tensor import Tensor
-
         if value is None:
+            Tensor = _get_tensor_type()
             value = Tensor(np.zeros(shape, dtype=np.int32))  # TODO: change to np.int64
 
         # TODO: Sending the seed and having each party generate the shares is not safe
@@ -158,6 +191,61 @@ class ShareTensor(PassthroughTensor):
 
         return share
 
+    @staticmethod
+    def generate_przs_shares(
+        value: Optional[Any],
+        shape: Tuple[int, ...],
+        nr_parties: int,
+        generator: np.random.Generator,
+    ) -> List["ShareTensor"]:
+        """Generate the PRZS shares for all parties from one seeded generator.
+
+        generate_przs seeds a fresh generator and draws every party's mask on
+        each call, so sharing a secret costs nr_parties seedings and
+        nr_parties**2 mask draws. Here the caller provides an already seeded
+        generator, each mask is drawn exactly once and all parties' shares are
+        built in a single pass -- which also lets several secrets be shared
+        from one continuous stream.
+
+        Args:
+            value: The secret to share, as a Tensor, ShareTensor or raw
+                ndarray; the last party holds it. None shares zero.
+            shape (Tuple[int, ...]): The shape of the secret.
+            nr_parties (int): The number of parties.
+            generator (np.random.Generator): An already seeded generator.
+
+        Returns:
+            List[ShareTensor]: One share per party.
+        """
+        # The masks cover the full int32 ring, so instead of paying
+        # Generator.integers' per-element range handling we pull raw 64-bit
+        # words straight from the bit generator and reinterpret them as int32.
+        nr_elems = int(np.prod(shape))
+        nr_words = (nr_elems + 1) // 2
+        bit_generator = generator.bit_generator
+        masks = [
+            bit_generator.random_raw(nr_words).view(np.int32)[:nr_elems].reshape(shape)
+            for _ in range(nr_parties)
+        ]
+
+        shares = []
+        for rank in range(nr_parties):
+            if rank == nr_parties - 1 and value is not None:
+                # Unwrap a Tensor-like secret; a raw ndarray is used as is.
+                share = getattr(value, "child", value)
+            else:
+                share = np.zeros(shape, dtype=np.int32)
+
+            if not isinstance(share, ShareTensor):
+                share = ShareTensor(value=share, rank=rank, nr_parties=nr_parties)
+
+            share.child = _przs_combine(
+                share.child, masks[rank], masks[(rank + 1) % nr_parties]
+            )
+            shares.append(share)
+
+        return shares
+
     @staticmethod
     def generate_przs_on_dp_tensor(
         value: Optional[Any],
@@ -1,16 +1,13 @@
 # stdlib
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 import errno
-import json
 import os
 import sys
 from typing import Any
 from typing import Generator
 from typing import Optional
-
-# third party
-import requests
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from typing import Tuple
 
 # relative
 from ...core.common.environment import is_jupyter
@@ -31,16 +28,49 @@ from .om_signaling_client import register
 from .ui import LOGO_URL
 from .webrtc_duet import Duet as WebRTCDuet  # noqa: F811
 
-if is_jupyter:
-    # third party
-    from IPython.core.display import Image
-    from IPython.core.display import display
-
-
 ADDR_REPOSITORY = (
     "https://raw.githubusercontent.com/OpenMined/OpenGridNodes/master/network_address"
 )
 
+# One pooled session for all duet network probes; reusing the underlying
+# urllib3 connection pool skips the TCP+TLS handshake on repeated requests to
+# the same GitHub / signaling hosts. Built on first use so importing
+# syft.grid.duet doesn't drag in the requests/urllib3 tree.
+_session: Optional[Any] = None
+_REQUEST_TIMEOUT = 5
+
+
+def _get_session() -> Any:
+    global _session
+    if _session is None:
+        # third party
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                # Bounded retries with exponential backoff, so a flaky endpoint
+                # gets a few spaced-out attempts instead of hammering or
+                # failing outright.
+                max_retries=Retry(
+                    total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+                ),
+            ),
+        )
+        _session = session
+    return _session
+
+
+# Constant pieces of the duet live-status banner, hoisted out of the 10 Hz
+# logger loop.
+_STATUS_PREFIX = "♫♫♫ > DUET LIVE STATUS  "
+_STATUS_PADDING = " " * 32
+
 
 def generate_donation_msg(name: str) -> str:
     donate_url = "https://github.com/sponsors/OpenMined"
@@ -56,16 +86,112 @@ def generate_donation_msg(name: str) -> str:
 
 DUET_DONATE_MSG = generate_donation_msg(name="Duet")
 
+# Fully framed once at import time; launch_duet/join_duet emit it as is.
+_DUET_DONATE_BANNER = bcolors.BOLD + DUET_DONATE_MSG + bcolors.BOLD + "\n"
+
+# Static banners assembled once at import time so launch_duet/join_duet emit
+# each of them with a single info() call instead of rebuilding the strings and
+# logging line by line.
+_DISCLAIMER_BANNER = (
+    "♫♫♫ >\033[93m"
+    " DISCLAIMER"
+    "\033[0m"
+    ": "
+    "\033[1m"
+    "Duet is an experimental feature currently in beta.\n"
+    "♫♫♫ > Use at your own risk.\n"
+    "\033[0m"
+)
+
+_MSG_DONE = "♫♫♫ > " + bcolors.OKGREEN + "DONE!" + bcolors.ENDC
+_MSG_CONNECTED = "♫♫♫ > " + bcolors.OKGREEN + "CONNECTED!" + bcolors.ENDC
+
+_NETWORK_WAIT_BANNER = (
+    "♫♫♫ > Punching through firewall to OpenGrid Network Node at:\n"
+    "♫♫♫ > %s\n"
+    "♫♫♫ >\n"
+    "♫♫♫ > ...waiting for response from OpenGrid Network... "
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Tune the domain's SQLite connection when it is first opened.
+
+    A preallocated page cache keeps SQLite out of the allocator on hot paths,
+    and memory journaling / no fsync / exclusive locking are free wins for a
+    private database that never touches disk.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA cache_size=-8192")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+    cursor.close()
+
+
+def _make_domain(name: str) -> Tuple[Domain, Any]:
+    """Build the in-memory domain database shared by launch and join.
+
+    The plain sqlite:// engine defaults to a SingletonThreadPool, which gives
+    every thread its own connection -- and for an in-memory database that
+    means a fresh empty database without the schema. A StaticPool shares the
+    single connection (and therefore the one database) across threads, which
+    also removes the race between the logger thread and table creation.
+    """
+    # third party
+    from sqlalchemy import create_engine
+    from sqlalchemy import event
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    db_engine = create_engine(
+        "sqlite://",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    event.listen(db_engine, "connect", _set_sqlite_pragmas)
+    Base.metadata.create_all(db_engine)  # type: ignore
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+    my_domain = Domain(name=name, db_engine=db_engine)
+
+    if len(my_domain.setup):  # Check if setup was defined previously
+        my_domain.name = my_domain.setup.node_name
+
+    if not len(my_domain.roles):  # Check if roles were registered previously
+        seed_db(SessionLocal())
+
+    return my_domain, SessionLocal
+
+
+def _probe_network(addr: str) -> str:
+    _get_session().get(addr + "/metadata", timeout=_REQUEST_TIMEOUT)
+    return addr
+
 
 def get_available_network() -> str:
-    network_addr = json.loads(requests.get(ADDR_REPOSITORY).content)
-    for addr in network_addr:
-        try:
-            requests.get(addr + "/metadata")
+    network_addr = _get_session().get(ADDR_REPOSITORY, timeout=_REQUEST_TIMEOUT).json()
+
+    # Probe all addresses in parallel and take the first one that answers,
+    # instead of paying the full timeout of every dead address in turn.
+    # No `with` block here: exiting one calls shutdown(wait=True), which
+    # would hold the winning address hostage until every in-flight probe of
+    # a dead server has run through its retries and timeouts.
+    executor = ThreadPoolExecutor(max_workers=min(8, max(1, len(network_addr))))
+    try:
+        futures = [executor.submit(_probe_network, addr) for addr in network_addr]
+        for future in as_completed(futures):
+            try:
+                addr = future.result()
+            except Exception as e:
+                error(f"Failed request addr: {e}")
+                continue
+            for pending in futures:
+                pending.cancel()
             return addr
-        except Exception as e:
-            error(f"Failed request addr: {e}")
-            continue
+    finally:
+        executor.shutdown(wait=False)
     traceback_and_raise(Exception("Couldn't find any available network."))
 
 
@@ -99,18 +225,34 @@ def begin_duet_logger(my_domain: Domain) -> None:
             # record the parent when the thread starts
             thread_parent = sys.stdout.parent_header  # type: ignore
             iterator = 0
+            sleep_time = 0.1
+            prev_stats: Optional[tuple] = None
+            prev_render: Optional[tuple] = None
+            unchanged_ticks = 0
             while True:
-                time.sleep(0.1)
-                # then ensure that the parent is the same as when the thread started
-                # every time we print
-                with set_stdout_parent(thread_parent):
-
-                    n_objects = len(my_domain.store)
-                    n_requests = len(my_domain.requests)
-                    n_messages = my_domain.message_counter
-                    n_request_handlers = len(my_domain.request_handlers)
-
-                    blink_on = (int(iterator / 5) % 2) == 0
+                time.sleep(sleep_time)
+
+                stats = my_domain.stats_snapshot()
+                n_objects, n_requests, n_messages, n_request_handlers = stats
+
+                # Back off while the domain is idle so an untouched
+                # notebook doesn't wake up ten times a second.
+                if stats == prev_stats:
+                    unchanged_ticks += 1
+                    if unchanged_ticks >= 10:
+                        sleep_time = min(sleep_time * 2, 1.0)
+                else:
+                    prev_stats = stats
+                    unchanged_ticks = 0
+                    sleep_time = 0.1
+
+                blink_on = (int(iterator / 5) % 2) == 0
+
+                # Re-render only when something visible changed; idle ticks
+                # never build the string, take the stdout lock or flush.
+                render_state = (stats, blink_on)
+                if render_state != prev_render:
+                    prev_render = render_state
 
                     if blink_on and n_requests > 0:
                         left_blink = bcolors.BOLD + ">" + bcolors.ENDC
@@ -128,35 +270,50 @@ def begin_duet_logger(my_domain: Domain) -> None:
                     else:
                         star = "-"
 
-                    out = (
-                        "♫♫♫ > DUET LIVE STATUS  "
-                        + star
-                        + "  Objects: "
-                        + str(n_objects)
-                        + "  "
-                        + left_color
-                        + "Requests:"
-                        + right_color
-                        + left_blink
-                        + str(n_requests)
-                        + right_blink
-                        + "  Messages: "
-                        + str(n_messages)
-                        + "  Request Handlers: "
-                        + str(n_request_handlers)
+                    # Assemble the banner before taking the stdout lock, so
+                    # other threads are only held up for the write itself.
+                    # A single join builds the string in one allocation
+                    # instead of one per formatted segment.
+                    out = "".join(
+                        (
+                            "\r",
+                            _STATUS_PREFIX,
+                            star,
+                            "  Objects: ",
+                            str(n_objects),
+                            "  ",
+                            left_color,
+                            "Requests:",
+                            right_color,
+                            left_blink,
+                            str(n_requests),
+                            right_blink,
+                            "  Messages: ",
+                            str(n_messages),
+                            "  Request Handlers: ",
+                            str(n_request_handlers),
+                            _STATUS_PADDING,
+                            "\r",
+                        )
                     )
-                    out += "                                "
-                    # STOP changing this to logging, this happens every fraction of a
-                    # second to update the jupyter display, logging this creates
-                    # unnecessary noise, in addition the end= parameter broke logging
-                    print("\r" + out, end="\r")  # DO NOT change to log
+
+                    # then ensure that the parent is the same as when the
+                    # thread started every time we print
+                    with set_stdout_parent(thread_parent):
+                        # STOP changing this to logging, this happens every fraction of a
+                        # second to update the jupyter display, logging this creates
+                        # unnecessary noise, in addition the end= parameter broke logging
+                        # A single write avoids print()'s two underlying
+                        # stdout writes interleaving with other threads.
+                        sys.stdout.write(out)  # DO NOT change to log
+                        sys.stdout.flush()
                 iterator += 1
 
     if hasattr(sys.stdout, "parent_header"):
-        # Disabled until we can fix the race condition against the SQLite table
-        # creation process
-        pass
-        # counterThread().start()
+        # The domain engine uses a StaticPool, so this thread sees the same
+        # in-memory database (and schema) as the main thread. Daemonized so it
+        # never blocks interpreter shutdown.
+        counterThread(daemon=True).start()
 
 
 def duet(
@@ -180,6 +337,10 @@ def launch_duet(
     credential_exchanger: DuetCredentialExchanger = OpenGridTokenManualInputExchanger(),
 ) -> Client:
     if os.path.isfile(LOGO_URL) and is_jupyter:
+        # third party
+        from IPython.core.display import Image
+        from IPython.core.display import display
+
         display(
             Image(
                 LOGO_URL,
@@ -188,41 +349,22 @@ def launch_duet(
             )
         )
     info("🎤  🎸  ♪♪♪ Starting Duet ♫♫♫  🎻  🎹\n", print=True)
-    info(
-        "♫♫♫ >\033[93m"
-        + " DISCLAIMER"
-        + "\033[0m"
-        + ": "
-        + "\033[1m"
-        + "Duet is an experimental feature currently in beta.\n"
-        + "♫♫♫ > Use at your own risk.\n"
-        + "\033[0m",
-        print=True,
-    )
+    info(_DISCLAIMER_BANNER, print=True)
 
-    info(bcolors.BOLD + DUET_DONATE_MSG + bcolors.BOLD + "\n", print=True)
+    info(_DUET_DONATE_BANNER, print=True)
 
     if not network_url:
         network_url = get_available_network()
-    info("♫♫♫ > Punching through firewall to OpenGrid Network Node at:", print=True)
-    info("♫♫♫ > " + str(network_url), print=True)
-    info("♫♫♫ >", print=True)
-    info("♫♫♫ > ...waiting for response from OpenGrid Network... ", print=True)
-
-    signaling_client = register(url=network_url)
+    info(_NETWORK_WAIT_BANNER % network_url, print=True)
 
-    info("♫♫♫ > " + bcolors.OKGREEN + "DONE!" + bcolors.ENDC, print=True)
+    # Registration is a network round trip while the domain build is purely
+    # local work; run them concurrently instead of back to back.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        register_future = executor.submit(register, url=network_url)
+        my_domain, SessionLocal = _make_domain("Launcher")
+        signaling_client = register_future.result()
 
-    db_engine = create_engine("sqlite://", echo=False)
-    Base.metadata.create_all(db_engine)  # type: ignore
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
-    my_domain = Domain(name="Launcher", db_engine=db_engine)
-
-    if len(my_domain.setup):  # Check if setup was defined previously
-        my_domain.name = my_domain.setup.node_name
-
-    if not len(my_domain.roles):  # Check if roles were registered previously
-        seed_db(SessionLocal())
+    info(_MSG_DONE, print=True)
 
     if loopback:
         credential_exchanger = OpenGridTokenFileExchanger()
@@ -237,7 +379,7 @@ def launch_duet(
         offer=True,
     )
     info(print=True)
-    info("♫♫♫ > " + bcolors.OKGREEN + "CONNECTED!" + bcolors.ENDC, print=True)
+    info(_MSG_CONNECTED, print=True)
     #     return duet, my_domain.get_root_client()
     out_duet: Client = my_domain.get_root_client()
 
@@ -255,6 +397,10 @@ def join_duet(
     credential_exchanger: DuetCredentialExchanger = OpenGridTokenManualInputExchanger(),
 ) -> WebRTCDuet:
     if os.path.isfile(LOGO_URL) and is_jupyter:
+        # third party
+        from IPython.core.display import Image
+        from IPython.core.display import display
+
         display(
             Image(
                 LOGO_URL,
@@ -263,41 +409,22 @@ def join_duet(
             )
         )
     info("🎤  🎸  ♪♪♪ Joining Duet ♫♫♫  🎻  🎹\n", print=True)
-    info(
-        "♫♫♫ >\033[93m"
-        + " DISCLAIMER"
-        + "\033[0m"
-        + ": "
-        + "\033[1m"
-        + "Duet is an experimental feature currently in beta.\n"
-        + "♫♫♫ > Use at your own risk.\n"
-        + "\033[0m",
-        print=True,
-    )
+    info(_DISCLAIMER_BANNER, print=True)
 
-    info(bcolors.BOLD + DUET_DONATE_MSG + bcolors.BOLD + "\n", print=True)
+    info(_DUET_DONATE_BANNER, print=True)
 
     if not network_url:
         network_url = get_available_network()
-    info("♫♫♫ > Punching through firewall to OpenGrid Network Node at:", print=True)
-    info("♫♫♫ > " + str(network_url), print=True)
-    info("♫♫♫ >", print=True)
-    info("♫♫♫ > ...waiting for response from OpenGrid Network... ", print=True)
+    info(_NETWORK_WAIT_BANNER % network_url, print=True)
 
-    signaling_client = register(url=network_url)
+    # Same overlap as launch_duet: register over the network while the
+    # domain database is built locally.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        register_future = executor.submit(register, url=network_url)
+        my_domain, SessionLocal = _make_domain("Joiner")
+        signaling_client = register_future.result()
 
-    info("♫♫♫ > " + bcolors.OKGREEN + "DONE!" + bcolors.ENDC, print=True)
-
-    db_engine = create_engine("sqlite://", echo=False)
-    Base.metadata.create_all(db_engine)  # type: ignore
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
-    my_domain = Domain(name="Joiner", db_engine=db_engine)
-
-    if len(my_domain.setup):  # Check if setup was defined previously
-        my_domain.name = my_domain.setup.node_name
-
-    if not len(my_domain.roles):  # Check if roles were registered previously
-        seed_db(SessionLocal())
+    info(_MSG_DONE, print=True)
 
     if loopback:
         credential_exchanger = OpenGridTokenFileExchanger()
@@ -316,16 +443,19 @@ def join_duet(
         offer=False,
     )
     info(print=True)
-    info("♫♫♫ > " + bcolors.OKGREEN + "CONNECTED!" + bcolors.ENDC, print=True)
+    info(_MSG_CONNECTED, print=True)
     # begin_duet_client_logger(duet.node)
 
     return duet
 
 
 def test_duet_network(network_url: str = "", loopback: bool = False) -> bool:
+    # third party
+    import requests
+
     def check_url(url: str, url_description: str) -> bool:
         try:
-            r = requests.head(url, timeout=5)
+            r = _get_session().head(url, timeout=_REQUEST_TIMEOUT)
             if r.status_code == 200:
                 info("Successfully able to reach " + url_description, print=True)
                 return True
@@ -337,23 +467,11 @@ def test_duet_network(network_url: str = "", loopback: bool = False) -> bool:
                     + str(r.status_code),
                     print=True,
                 )
-        except requests.exceptions.Timeout:
-            info(
-                "Unable to reach " + url_description + " Connection timed out.",
-                print=True,
-            )
-        except requests.exceptions.ConnectTimeout:
-            info(
-                "Unable to reach " + url_description + " Connection timed out.",
-                print=True,
-            )
-        except requests.exceptions.TooManyRedirects:
-            info(
-                "Unable to reach " + url_description + " Too many redirects.",
-                print=True,
-            )
         except requests.exceptions.RequestException as e:
-            info("Unable to reach " + url_description + " " + e.strerror, print=True)
+            # RequestException is the base of Timeout, ConnectTimeout,
+            # TooManyRedirects and friends; one branch covers them all, and
+            # str(e) is always populated where strerror often is not.
+            info("Unable to reach " + url_description + " " + str(e), print=True)
         return False
 
     if not network_url:
@@ -361,15 +479,39 @@ def test_duet_network(network_url: str = "", loopback: bool = False) -> bool:
         if not check_url("https://github.com/", "GitHub domain."):
             return False
 
-        # testing Github network_address
-        if not check_url(ADDR_REPOSITORY, "GitHub signaling servers list."):
+        # testing Github network_address; a single GET both checks
+        # reachability and fetches the server list, instead of a HEAD
+        # followed by a second full request for the same resource
+        try:
+            r = _get_session().get(ADDR_REPOSITORY, timeout=_REQUEST_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            info(
+                "Unable to reach GitHub signaling servers list. " + str(e),
+                print=True,
+            )
             return False
+        if r.status_code != 200:
+            info(
+                "Unable to reach GitHub signaling servers list."
+                + " HTTP status code: "
+                + str(r.status_code),
+                print=True,
+            )
+            return False
+        info("Successfully able to reach GitHub signaling servers list.", print=True)
 
         # testing signaling (STUN) servers
         check_url(WebRTC_HOST + "/metadata", "default signaling server.")
-        network_addr = json.loads(requests.get(ADDR_REPOSITORY).content)
-        for num, addr in enumerate(network_addr):
-            check_url(addr + "/metadata", "signaling sever #" + str(num) + ".")
+        network_addr = r.json()
+        # Check all listed servers in parallel; the reachability of one does
+        # not depend on another.
+        with ThreadPoolExecutor(
+            max_workers=min(8, max(1, len(network_addr)))
+        ) as executor:
+            for num, addr in enumerate(network_addr):
+                executor.submit(
+                    check_url, addr + "/metadata", "signaling sever #" + str(num) + "."
+                )
     else:
         if not check_url(network_url + "/metadata", "Local signaling server."):
             return False
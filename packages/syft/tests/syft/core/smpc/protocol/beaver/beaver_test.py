@@ -1,5 +1,36 @@
+# stdlib
+import operator
+
+# third party
+import numpy as np
+import pytest
+
 # syft absolute
+from syft.core.smpc.protocol.beaver.beaver import _get_triples
+from syft.core.smpc.protocol.beaver.beaver import _store_add_triples
+from syft.core.smpc.protocol.beaver.beaver import _store_get_triple
 from syft.core.smpc.store import CryptoPrimitiveProvider
+from syft.core.smpc.store.exceptions import EmptyPrimitiveStore
+from syft.core.tensor.smpc.share_tensor import ShareTensor
+
+
+def _make_triple(offset: int) -> list:
+    """Build one a/b/c triple whose values encode its insertion order."""
+    return [
+        ShareTensor(
+            rank=0,
+            nr_parties=2,
+            value=np.full((2, 2), offset + component, dtype=np.int32),
+        )
+        for component in range(3)
+    ]
+
+
+def _assert_triple_values(triple: list, offset: int) -> None:
+    for component, share in enumerate(triple):
+        assert np.array_equal(
+            share.child, np.full((2, 2), offset + component, dtype=np.int32)
+        )
 
 
 def test_beaver_mul(get_clients) -> None:
@@ -24,3 +55,84 @@ def test_beaver_mul(get_clients) -> None:
         primitive = primitive[0]
         for x, y in zip(triple, primitive):
             assert x == y
+
+
+def test_store_get_advances_head() -> None:
+    store: dict = {}
+    _store_add_triples(store, "key", [_make_triple(0), _make_triple(10)])
+
+    _assert_triple_values(_store_get_triple(store, "key", remove=True), 0)
+    _assert_triple_values(_store_get_triple(store, "key", remove=True), 10)
+
+    with pytest.raises(EmptyPrimitiveStore):
+        _store_get_triple(store, "key", remove=True)
+
+
+def test_store_get_peek_does_not_consume() -> None:
+    store: dict = {}
+    _store_add_triples(store, "key", [_make_triple(0)])
+
+    _assert_triple_values(_store_get_triple(store, "key", remove=False), 0)
+    # A peek leaves the head in place, so the same triple is still available.
+    _assert_triple_values(_store_get_triple(store, "key", remove=True), 0)
+
+    with pytest.raises(EmptyPrimitiveStore):
+        _store_get_triple(store, "key", remove=False)
+
+
+def test_store_get_missing_key() -> None:
+    with pytest.raises(EmptyPrimitiveStore):
+        _store_get_triple({}, "missing", remove=True)
+
+
+def test_store_refill_preserves_fifo_order() -> None:
+    store: dict = {}
+    _store_add_triples(store, "key", [_make_triple(0), _make_triple(10)])
+    _store_get_triple(store, "key", remove=True)
+
+    # Refilling after partial consumption drops the consumed prefix but must
+    # keep the remaining triples ahead of the new ones.
+    _store_add_triples(store, "key", [_make_triple(20)])
+
+    _assert_triple_values(_store_get_triple(store, "key", remove=True), 10)
+    _assert_triple_values(_store_get_triple(store, "key", remove=True), 20)
+
+    with pytest.raises(EmptyPrimitiveStore):
+        _store_get_triple(store, "key", remove=True)
+
+
+def _reconstruct(shares: list) -> np.ndarray:
+    """Rebuild the plain value modulo 2**32 from one share per party."""
+    total = sum(share.child.astype(np.uint64) for share in shares)
+    return total & np.uint64(2 ** 32 - 1)
+
+
+@pytest.mark.parametrize(
+    "op_str,a_shape,b_shape",
+    [("mul", (2, 2), (2, 2)), ("matmul", (2, 3), (3, 2))],
+)
+def test_get_triples_batched_consistency(op_str, a_shape, b_shape) -> None:
+    op = getattr(operator, op_str)
+    nr_parties = 2
+    count = 3
+
+    triples = _get_triples(op_str, nr_parties, a_shape, b_shape, count=count)
+
+    assert len(triples) == nr_parties
+    assert all(len(party_triples) == count for party_triples in triples)
+
+    for instance in range(count):
+        a, b, c = (
+            _reconstruct(
+                [triples[party][instance][component] for party in range(nr_parties)]
+            )
+            for component in range(3)
+        )
+        # Congruence survives the uint64 wraparound, so reducing the product
+        # modulo the ring recovers the expected c for each instance.
+        assert np.array_equal(c, op(a, b) & np.uint64(2 ** 32 - 1))
+
+
+def test_get_triples_rejects_non_positive_count() -> None:
+    with pytest.raises(ValueError):
+        _get_triples("mul", 2, (2, 2), (2, 2), count=0)